@@ -9,6 +9,8 @@ import unicodedata
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
+from recherche_requetes import construire_index_requetes, filtrer_requetes_emails
+
 # ==============================
 # Config & Secrets
 # ==============================
@@ -23,6 +25,7 @@ RANGE_NAME = 'Besoins ASI!A1:Z1000'  # Plage de données dans Google Sheets
 OUTPUT_DIR = "out_fiches"
 INDEX_CSV = "fiches_index.csv"
 REQUETE_EMAILS_CSV = "requete_emails.csv"
+REQUETES_PAR_PAGE = 20  # Entrées affichées par page dans l'onglet Requêtes & Emails
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ==============================
@@ -407,16 +410,30 @@ def save_requete_email(titre_poste: str, ville: str, requete: str, email: str):
             "email": email or ""
         })
 
-def load_requetes_emails():
-    if not os.path.exists(REQUETE_EMAILS_CSV):
-        return []
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_requetes_emails_indexed(path: str, mtime_ns: int, size: int):
+    """Lit et trie le CSV une seule fois par version du fichier (clé = mtime + taille).
+    Retourne (rows, vocab, postings), cf. construire_index_requetes.
+    Le résultat est partagé entre les reruns : ne pas le modifier."""
     rows = []
-    with open(REQUETE_EMAILS_CSV, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for r in reader:
             rows.append(r)
     rows.sort(key=lambda r: r.get("timestamp", ""), reverse=True)
-    return rows
+
+    vocab, postings = construire_index_requetes(rows)
+    return rows, vocab, postings
+
+def lire_export_requetes_emails():
+    with open(REQUETE_EMAILS_CSV, "rb") as f:
+        return f.read()
+
+def load_requetes_emails_indexed():
+    if not os.path.exists(REQUETE_EMAILS_CSV):
+        return [], [], {}
+    info = os.stat(REQUETE_EMAILS_CSV)
+    return _load_requetes_emails_indexed(REQUETE_EMAILS_CSV, info.st_mtime_ns, info.st_size)
 
 def generate_and_store_requete_email(contenu_fiche: str, meta: dict):
     titre = (meta or {}).get("titre_poste") or "Fiche (sans titre)"
@@ -626,20 +643,30 @@ with tab_fiches:
 # -------- Onglet Requêtes & Emails (5ᵉ onglet) --------
 with tab_requetes:
     st.subheader("Historique — Requêtes LinkedIn & Emails")
-    requetes = load_requetes_emails()
-    filtre = st.text_input("🔎 Filtrer (poste / ville / contenu requête / email)", "")
-
-    if filtre:
-        f = filtre.lower()
-        def ok(r):
-            hay = " ".join([r.get("titre_poste",""), r.get("ville",""), r.get("requete",""), r.get("email","")]).lower()
-            return f in hay
-        requetes = list(filter(ok, requetes))
-
-    if not requetes:
-        st.info("Pas encore d'historique. Générez une requête depuis une fiche.")
+    requetes, vocab, postings = load_requetes_emails_indexed()
+    filtre = st.text_input("🔎 Filtrer (poste / ville / contenu requête)", "")
+
+    # Positions dans l'historique trié (récent → ancien) ; None = pas de filtre
+    positions = filtrer_requetes_emails(filtre, vocab, postings)
+    total = len(requetes) if positions is None else len(positions)
+
+    if not total:
+        st.info("Pas encore d'historique. Générez une requête depuis une fiche."
+                if not requetes else "Aucune entrée ne correspond au filtre.")
     else:
-        for i, r in enumerate(requetes):
+        nb_pages = (total + REQUETES_PAR_PAGE - 1) // REQUETES_PAR_PAGE
+        page = 1
+        if nb_pages > 1:
+            page = st.number_input(f"Page (sur {nb_pages})", min_value=1, max_value=nb_pages, value=1, step=1,
+                                   key=f"hist_page_{filtre}")  # revient à la page 1 si le filtre change
+        debut = (page - 1) * REQUETES_PAR_PAGE
+        fin = min(debut + REQUETES_PAR_PAGE, total)
+        st.caption(f"Entrées {debut + 1}–{fin} sur {total}")
+
+        # Seules les entrées de la page courante créent des widgets
+        visibles = range(debut, fin) if positions is None else positions[debut:fin]
+        for i in visibles:
+            r = requetes[i]
             with st.container(border=True):
                 st.markdown(f"**{r.get('titre_poste','(sans titre)')}** — {r.get('ville','')}  \n"
                             f"🕒 {r.get('timestamp','')}")
@@ -647,8 +674,8 @@ with tab_requetes:
                     st.code(r.get("requete",""))
                 with st.expander("✉️ Email"):
                     st.text_area("Email", r.get("email",""), height=220, key=f"hist_email_{i}")
-        # Export CSV
-        if os.path.exists(REQUETE_EMAILS_CSV):
-            with open(REQUETE_EMAILS_CSV, "r", encoding="utf-8") as f:
-                data = f.read()
-            st.download_button("📥 Exporter l'historique (CSV)", data=data, file_name="requete_emails.csv", mime="text/csv")
+
+    # Export CSV (fichier lu uniquement au clic, pas à chaque rerun)
+    if requetes and os.path.exists(REQUETE_EMAILS_CSV):
+        st.download_button("📥 Exporter l'historique (CSV)", data=lire_export_requetes_emails,
+                           file_name="requete_emails.csv", mime="text/csv")
@@ -0,0 +1,64 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+# ==============================
+# Index de recherche de l'historique Requêtes & Emails
+# (sans dépendance à Streamlit, pour pouvoir être testé seul)
+# ==============================
+
+# Termes sous cette longueur (« r », « c# », « go »…) : correspondance exacte uniquement
+LONGUEUR_MIN_PREFIXE = 3
+
+# Mot (lettres/chiffres, tout alphabet), avec « . » initial (.net) et « ++ »/« # » final (c++, c#)
+_TERME_RE = re.compile(r"(?:(?<![^\s(\[\"'])\.)?[^\W_]+(?:\+\+|#)?")
+
+def termes_recherche(value: str):
+    """Découpe un texte en termes minuscules sans accents (pour l'index de recherche)."""
+    value = unicodedata.normalize('NFKD', value or "")
+    value = "".join(c for c in value if not unicodedata.combining(c)).casefold()
+    return _TERME_RE.findall(value)
+
+def _formes_indexees(termes):
+    """Termes + leur forme nue (« .net » → « net », « c++ » → « c ») pour que « net » trouve « .NET »."""
+    formes = set(termes)
+    for t in termes:
+        nu = t.lstrip(".").rstrip("+#")
+        if nu:
+            formes.add(nu)
+    return formes
+
+def construire_index_requetes(rows):
+    """Retourne (vocab, postings) : postings[terme] = ensemble des positions dans rows,
+    vocab = liste triée des termes (recherche par préfixe via bisect)."""
+    postings = {}
+    for i, r in enumerate(rows):
+        terms = termes_recherche(r.get("titre_poste", ""))
+        terms += termes_recherche(r.get("ville", ""))
+        terms += termes_recherche(r.get("requete", ""))
+        for t in _formes_indexees(terms):
+            postings.setdefault(t, set()).add(i)
+    return sorted(postings), postings
+
+def filtrer_requetes_emails(filtre: str, vocab, postings):
+    """Positions (triées) des entrées contenant tous les termes du filtre, None si le filtre est vide.
+    Les termes d'au moins LONGUEUR_MIN_PREFIXE caractères sont traités comme des préfixes
+    (« dev » trouve « developpeur ») ; les plus courts doivent correspondre exactement."""
+    if not (filtre or "").strip():
+        return None
+    result = None
+    for q in termes_recherche(filtre):
+        if len(q) < LONGUEUR_MIN_PREFIXE:
+            matches = postings.get(q, set())
+        else:
+            matches = set()
+            j = bisect_left(vocab, q)
+            while j < len(vocab) and vocab[j].startswith(q):
+                matches |= postings[vocab[j]]
+                j += 1
+        result = matches if result is None else (result & matches)
+        if not result:
+            return []
+    if result is None:
+        return []  # filtre saisi mais sans terme exploitable (ponctuation seule)
+    return sorted(result)
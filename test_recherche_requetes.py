@@ -0,0 +1,46 @@
+from recherche_requetes import construire_index_requetes, filtrer_requetes_emails, termes_recherche
+
+ROWS = [
+    {"titre_poste": "Développeur C++", "ville": "Paris", "requete": '("C++" OR "Qt")'},
+    {"titre_poste": "Chef de projet", "ville": "Île-de-France", "requete": '("Chef de projet" OR "PMO")'},
+    {"titre_poste": "Développeur .NET", "ville": "Lyon", "requete": '("C#" OR ".NET" OR "ASP.NET")'},
+    {"titre_poste": "Ingénieur réseau", "ville": "Paris", "requete": '("Network engineer" OR "Cisco")'},
+    {"titre_poste": "Data scientist", "ville": "Москва", "requete": '("R" OR "Python")'},
+    {"titre_poste": "Développeur .NET", "ville": "Nantes", "requete": '(".NET" OR "C#")'},
+]
+
+def filtrer(filtre):
+    vocab, postings = construire_index_requetes(ROWS)
+    return filtrer_requetes_emails(filtre, vocab, postings)
+
+def test_termes_recherche_garde_cpp_csharp_dotnet():
+    assert termes_recherche("C++, C# et .NET") == ["c++", "c#", "et", ".net"]
+    assert termes_recherche("ASP.NET Île") == ["asp", "net", "ile"]
+
+def test_prefixe_et_accents():
+    assert filtrer("dev") == [0, 2, 5]
+    assert filtrer("ingenieur") == [3]
+
+def test_intersection_des_termes():
+    assert filtrer("dev paris") == [0]
+    assert filtrer("dev marseille") == []
+
+def test_termes_courts_en_correspondance_exacte():
+    assert filtrer("C++") == [0]
+    assert filtrer("C#") == [2, 5]
+    assert filtrer(".NET") == [2, 5]
+    assert filtrer("R") == [4]
+
+def test_filtre_vide_ou_sans_terme():
+    assert filtrer("") is None
+    assert filtrer("   ") is None
+    assert filtrer("—") == []
+    assert filtrer("!!") == []
+
+def test_alphabet_non_latin_indexe():
+    assert filtrer("москва") == [4]
+
+def test_forme_nue_des_termes_suffixes():
+    assert filtrer("net") == [2, 3, 5]  # .NET, ASP.NET et « Network »
+    assert filtrer("NET nantes") == [5]
+    assert filtrer("c") == [0, 2, 5]